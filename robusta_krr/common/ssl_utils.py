@@ -1,5 +1,6 @@
 import base64
 import os
+import shutil
 
 import certifi
 
@@ -7,18 +8,17 @@ CUSTOM_CERTIFICATE_PATH = "/tmp/custom_ca.pem"
 
 
 def append_custom_certificate(custom_ca: str) -> None:
-    with open(certifi.where(), "ab") as outfile:
+    # NOTE: Not cached at module level, as create_temporary_certificate replaces certifi.where
+    certifi_path = certifi.where()
+    with open(certifi_path, "ab") as outfile:
         outfile.write(base64.b64decode(custom_ca))
 
-    os.environ["WEBSOCKET_CLIENT_CA_BUNDLE"] = certifi.where()
+    os.environ["WEBSOCKET_CLIENT_CA_BUNDLE"] = certifi_path
 
 
 def create_temporary_certificate(custom_ca: str) -> None:
-    with open(certifi.where(), "rb") as base_cert:
-        base_cert_content = base_cert.read()
-
-    with open(CUSTOM_CERTIFICATE_PATH, "wb") as outfile:
-        outfile.write(base_cert_content)
+    with open(certifi.where(), "rb") as base_cert, open(CUSTOM_CERTIFICATE_PATH, "wb") as outfile:
+        shutil.copyfileobj(base_cert, outfile)
         outfile.write(base64.b64decode(custom_ca))
 
     os.environ["REQUESTS_CA_BUNDLE"] = CUSTOM_CERTIFICATE_PATH
@@ -77,6 +77,8 @@ RunResult = dict[ResourceType, ResourceRecommendation]
 SelfBS = TypeVar("SelfBS", bound="BaseStrategy")
 _StrategySettings = TypeVar("_StrategySettings", bound=StrategySettings)
 
+STRATEGIES_REGISTRY: dict[str, type[BaseStrategy]] = {}
+
 
 # An abstract base class for strategy implementation.
 # This class requires implementation of a 'run' method for calculating recommendation.
@@ -95,18 +97,32 @@ class BaseStrategy(abc.ABC, Generic[_StrategySettings]):
     The name of the strategy is the name of the class in lowercase, without the 'Strategy' suffix, if exists.
     If you want to change the name of the strategy, you can change the display_name class attribute.
 
-    The strategy will automatically be registered in the strategy registry using __subclasses__ mechanism.
+    The strategy will automatically be registered in the strategy registry when the subclass is defined.
     """
 
     display_name: str
     rich_console: bool = False
 
+    _settings_type: type[StrategySettings] = StrategySettings
+
     # TODO: this should be BaseMetric, but currently we only support Prometheus
     @property
     @abc.abstractmethod
     def metrics(self) -> Sequence[type[PrometheusMetric]]:
         pass
 
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+
+        # NOTE: Only direct subclasses are strategies, the same as with the former __subclasses__ lookup
+        if BaseStrategy in cls.__bases__:
+            STRATEGIES_REGISTRY[cls.display_name.lower()] = cls
+
+        # NOTE: The settings type is resolved from the generic base once, subclasses without their own inherit it
+        settings_args = get_args(cls.__dict__.get("__orig_bases__", (None,))[0])
+        if settings_args:
+            cls._settings_type = settings_args[0]
+
     def __init__(self, settings: _StrategySettings):
         self.settings = settings
 
@@ -141,12 +157,12 @@ class BaseStrategy(abc.ABC, Generic[_StrategySettings]):
     def get_all(cls: type[SelfBS]) -> dict[str, type[SelfBS]]:
         from robusta_krr import strategies as _  # noqa: F401
 
-        return {sub_cls.display_name.lower(): sub_cls for sub_cls in cls.__subclasses__()}
+        return dict(STRATEGIES_REGISTRY)  # type: ignore
 
     # This method is intended to return the type of settings used in strategy.
     @classmethod
     def get_settings_type(cls) -> type[StrategySettings]:
-        return get_args(cls.__orig_bases__[0])[0]  # type: ignore
+        return cls._settings_type
 
 
 AnyStrategy = BaseStrategy[StrategySettings]
@@ -121,7 +121,7 @@ class ClusterLoader:
             loop = asyncio.get_running_loop()
 
             async with self.__jobs_loading_locks[namespace]:
-                logging.debug(f"Loading jobs for cronjobs in {namespace}")
+                logger.debug(f"Loading jobs for cronjobs in {namespace}")
                 ret = await loop.run_in_executor(
                     self.executor,
                     lambda: self.batch.list_namespaced_job(namespace=namespace),
@@ -324,7 +324,7 @@ class ClusterLoader:
 
             loop = asyncio.get_running_loop()
 
-            logging.debug(
+            logger.debug(
                 f"Rollout has workloadRef, fetching template for {item.metadata.name} in {item.metadata.namespace}"
             )
 
@@ -1,3 +1,26 @@
-from .loader import PrometheusMetricsLoader
-from .metrics_service.prometheus_metrics_service import PrometheusDiscovery, PrometheusNotFound
-from .prometheus_utils import ClusterNotSpecifiedException
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .loader import PrometheusMetricsLoader
+    from .metrics_service.prometheus_metrics_service import PrometheusDiscovery, PrometheusNotFound
+    from .prometheus_utils import ClusterNotSpecifiedException
+
+# NOTE: The loader and the metrics services import prometrix (and through it pandas and matplotlib), which is slow.
+#       They are imported on first access, so that strategies importing `.metrics` do not pay for it on CLI startup.
+_LAZY_IMPORTS: dict[str, str] = {
+    "PrometheusMetricsLoader": ".loader",
+    "PrometheusDiscovery": ".metrics_service.prometheus_metrics_service",
+    "PrometheusNotFound": ".metrics_service.prometheus_metrics_service",
+    "ClusterNotSpecifiedException": ".prometheus_utils",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    return getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+
+
+__all__ = ["PrometheusMetricsLoader", "PrometheusDiscovery", "PrometheusNotFound", "ClusterNotSpecifiedException"]
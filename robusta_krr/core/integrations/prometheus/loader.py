@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import datetime
 import logging
 from concurrent.futures import ThreadPoolExecutor
@@ -117,7 +118,9 @@ class PrometheusMetricsLoader:
             ResourceHistoryData: The gathered resource history data.
         """
 
-        return {
-            MetricLoader.__name__: await self.loader.gather_data(object, MetricLoader, period, step)
-            for MetricLoader in strategy.metrics
-        }
+        # NOTE: strategy.metrics might build the loader classes on each access, so it is read only once
+        metrics = strategy.metrics
+        results = await asyncio.gather(
+            *[self.loader.gather_data(object, MetricLoader, period, step) for MetricLoader in metrics]
+        )
+        return {MetricLoader.__name__: result for MetricLoader, result in zip(metrics, results)}
@@ -6,17 +6,19 @@ import datetime
 import enum
 from concurrent.futures import ThreadPoolExecutor
 from functools import reduce
-from typing import Any, Optional, TypedDict
+from typing import TYPE_CHECKING, Any, Optional, TypedDict
 
 import numpy as np
 import pydantic as pd
-from prometrix import CustomPrometheusConnect
 
 from robusta_krr.core.abstract.metrics import BaseMetric
 from robusta_krr.core.abstract.strategies import PodsTimeData
 from robusta_krr.core.models.config import settings
 from robusta_krr.core.models.objects import K8sObjectData
 
+if TYPE_CHECKING:
+    from prometrix import CustomPrometheusConnect
+
 
 class PrometheusSeries(TypedDict):
     metric: dict[str, Any]
@@ -8,6 +8,7 @@ from typing import Iterable, List, Optional, Dict, Any
 from kubernetes.client import ApiClient
 from prometheus_api_client import PrometheusApiClientException
 from prometrix import PrometheusNotFound, get_custom_prometheus_connect
+from requests.adapters import HTTPAdapter
 
 from robusta_krr.core.abstract.strategies import PodsTimeData
 from robusta_krr.core.integrations import openshift
@@ -22,6 +23,11 @@ from .base_metric_service import MetricsService
 
 logger = logging.getLogger("krr")
 
+# NOTE: Mirrors HTTPAdapter(pool_maxsize=10, pool_block=True) in CustomPrometheusConnect.__init__
+#       (prometrix/connect/custom_connect.py, line 23 in the pinned prometrix 0.2.0).
+#       Re-check this and the `_session` remount below when bumping prometrix.
+PROMETRIX_POOL_MAXSIZE = 10
+
 
 class PrometheusDiscovery(MetricsServiceDiscovery):
     def find_metrics_url(self, *, api_client: Optional[ApiClient] = None) -> Optional[str]:
@@ -73,14 +79,14 @@ class PrometheusMetricsService(MetricsService):
         self.ssl_enabled = settings.prometheus_ssl_enabled
 
         if settings.openshift:
-            logging.info("Openshift flag is set, trying to load token from service account.")
+            logger.info("Openshift flag is set, trying to load token from service account.")
             openshift_token = openshift.load_token()
 
             if openshift_token:
-                logging.info("Openshift token is loaded successfully.")
+                logger.info("Openshift token is loaded successfully.")
                 self.auth_header = self.auth_header or f"Bearer {openshift_token}"
             else:
-                logging.warning("Openshift token is not found, trying to connect without it.")
+                logger.warning("Openshift token is not found, trying to connect without it.")
 
         self.prometheus_discovery = self.service_discovery(api_client=self.api_client)
 
@@ -106,6 +112,14 @@ class PrometheusMetricsService(MetricsService):
         self.prom_config = generate_prometheus_config(url=self.url, headers=headers, metrics_service=self)
         self.prometheus = get_custom_prometheus_connect(self.prom_config)
 
+        # NOTE: prometrix mounts a blocking pool of PROMETRIX_POOL_MAXSIZE connections on its private `_session`,
+        #       so with more workers than that the queries would wait for a free connection instead of running
+        #       concurrently. Remove this once the pool size can be configured in prometrix.
+        if settings.max_workers > PROMETRIX_POOL_MAXSIZE:
+            self.prometheus._session.mount(
+                self.prometheus.url, HTTPAdapter(pool_maxsize=settings.max_workers, pool_block=True)
+            )
+
     def check_connection(self):
         """
         Checks the connection to Prometheus.
@@ -176,7 +190,7 @@ class PrometheusMetricsService(MetricsService):
             start, end = values[0][0], values[-1][0]
             return datetime.fromtimestamp(start), datetime.fromtimestamp(end)
         except (KeyError, IndexError) as e:
-            logger.debug(f"Returned from get_history_range: {result}")
+            logger.debug("Returned from get_history_range: %s", result)
             raise ValueError("Error while getting history range") from e
 
     async def gather_data(
@@ -189,7 +203,7 @@ class PrometheusMetricsService(MetricsService):
         """
         ResourceHistoryData: The gathered resource history data.
         """
-        logger.debug(f"Gathering {LoaderClass.__name__} metric for {object}")
+        logger.debug("Gathering %s metric for %s", LoaderClass.__name__, object)
 
         metric_loader = LoaderClass(self.prometheus, self.name(), self.executor)
         data = await metric_loader.load_data(object, period, step)
@@ -244,10 +258,17 @@ class PrometheusMetricsService(MetricsService):
             sum(max(kube_pod_container_resource_requests{{ namespace='kube-system', resource='cpu' {cluster_label} }})  by (job, pod, container) )
         """
         try:
-            cluster_memory_result = await self.query_and_validate(memory_query)
-            cluster_cpu_result = await self.query_and_validate(cpu_query)
-            kube_system_mem_result = await self.query_and_validate(kube_system_requests_mem)
-            kube_system_cpu_result = await self.query_and_validate(kube_system_requests_cpu)
+            (
+                cluster_memory_result,
+                cluster_cpu_result,
+                kube_system_mem_result,
+                kube_system_cpu_result,
+            ) = await asyncio.gather(
+                self.query_and_validate(memory_query),
+                self.query_and_validate(cpu_query),
+                self.query_and_validate(kube_system_requests_mem),
+                self.query_and_validate(kube_system_requests_cpu),
+            )
             return {
                 "cluster_memory": float(cluster_memory_result),
                 "cluster_cpu": float(cluster_cpu_result),
@@ -267,7 +288,7 @@ class PrometheusMetricsService(MetricsService):
             period (timedelta): The time period for which to gather data.
         """
 
-        logger.debug(f"Adding historic pods for {object}")
+        logger.debug("Adding historic pods for %s", object)
 
         days_literal = min(int(period.total_seconds()) // 3600 // 24, 32)
         period_literal = f"{days_literal}d"
@@ -327,43 +348,47 @@ class PrometheusMetricsService(MetricsService):
             pod_owners = [object.name]
             pod_owner_kind = object.kind
 
-        related_pods_result = []
+        # NOTE: The batches are independent, so they are queried concurrently (bounded by the executor's workers)
         batch_size = int(os.environ.get("KRR_OWNER_BATCH_SIZE", 100))
-        for owner_group in batched(pod_owners, batch_size):
-            owners_regex = "|".join(owner_group)
-            related_pods_result_item = await self.query(
-                f"""
-                    last_over_time(
-                        kube_pod_owner{{
-                            owner_name=~"{owners_regex}",
-                            owner_kind="{pod_owner_kind}",
-                            namespace="{object.namespace}"
-                            {cluster_label}
-                        }}[{period_literal}]
-                    )
-                """
-            )
-            related_pods_result.extend(related_pods_result_item)
-        if related_pods_result == []:
-            return []
+        related_pods_results = await asyncio.gather(
+            *[
+                self.query(
+                    f"""
+                        last_over_time(
+                            kube_pod_owner{{
+                                owner_name=~"{'|'.join(owner_group)}",
+                                owner_kind="{pod_owner_kind}",
+                                namespace="{object.namespace}"
+                                {cluster_label}
+                            }}[{period_literal}]
+                        )
+                    """
+                )
+                for owner_group in batched(pod_owners, batch_size)
+            ]
+        )
+        related_pods = [pod["metric"]["pod"] for result in related_pods_results for pod in result]
+        del related_pods_results
 
-        related_pods = [pod["metric"]["pod"] for pod in related_pods_result]
-        current_pods_set = set()
-        del related_pods_result
+        if related_pods == []:
+            return []
 
-        for pod_group in batched(related_pods, 100):
-            group_regex = "|".join(pod_group)
-            pods_status_result = await self.query(
-                f"""
-                    kube_pod_status_phase{{
-                        phase="Running",
-                        pod=~"{group_regex}",
-                        namespace="{object.namespace}"
-                        {cluster_label}
-                    }} == 1
-                """
-            )
-            current_pods_set |= {pod["metric"]["pod"] for pod in pods_status_result}
-            del pods_status_result
+        pods_status_results = await asyncio.gather(
+            *[
+                self.query(
+                    f"""
+                        kube_pod_status_phase{{
+                            phase="Running",
+                            pod=~"{'|'.join(pod_group)}",
+                            namespace="{object.namespace}"
+                            {cluster_label}
+                        }} == 1
+                    """
+                )
+                for pod_group in batched(related_pods, 100)
+            ]
+        )
+        current_pods_set = {pod["metric"]["pod"] for result in pods_status_results for pod in result}
+        del pods_status_results
 
         return list({PodData(name=pod, deleted=pod not in current_pods_set) for pod in related_pods})
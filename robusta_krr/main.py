@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import inspect
 import logging
 from datetime import datetime
@@ -15,9 +16,8 @@ from typer.models import OptionInfo
 
 from robusta_krr import formatters as concrete_formatters  # noqa: F401
 from robusta_krr.core.abstract import formatters
-from robusta_krr.core.abstract.strategies import BaseStrategy
+from robusta_krr.core.abstract.strategies import BaseStrategy, StrategySettings
 from robusta_krr.core.models.config import Config
-from robusta_krr.core.runner import Runner
 from robusta_krr.utils.version import get_version
 
 app = typer.Typer(
@@ -38,9 +38,14 @@ def version() -> None:
     typer.echo(get_version())
 
 
+PRIMITIVE_TYPES = frozenset({int, float, str, bool, datetime, UUID})
+
+
+# NOTE: Settings fields of all strategies share only a handful of distinct types
+@functools.lru_cache(maxsize=None)
 def __process_type(_T: type) -> type:
     """Process type to a python literal"""
-    if _T in (int, float, str, bool, datetime, UUID):
+    if _T in PRIMITIVE_TYPES:
         return _T
     elif _T is Optional:
         return Optional[{__process_type(_T.__args__[0])}]  # type: ignore
@@ -48,6 +53,30 @@ def __process_type(_T: type) -> type:
         return str  # If the type is unknown, just use str and let pydantic handle it
 
 
+def __get_settings_parameters(settings_type: type[StrategySettings]) -> list[inspect.Parameter]:
+    """Build the keyword-only CLI parameters for the fields of the strategy settings"""
+    parameters = []
+    for field_name, field_meta in settings_type.__fields__.items():
+        if "_" in field_name:
+            param_decls = [f"--{field_name}", f"--{field_name.replace('_', '-')}"]
+        else:
+            param_decls = [f"--{field_name}"]
+        parameters.append(
+            inspect.Parameter(
+                name=field_name,
+                kind=inspect.Parameter.KEYWORD_ONLY,
+                default=OptionInfo(
+                    default=field_meta.default,
+                    param_decls=param_decls,
+                    help=f"{field_meta.field_info.description}",
+                    rich_help_panel="Strategy Settings",
+                ),
+                annotation=__process_type(field_meta.type_),
+            )
+        )
+    return parameters
+
+
 def load_commands() -> None:
     for strategy_name, strategy_type in BaseStrategy.get_all().items():  # type: ignore
         # NOTE: This wrapper here is needed to avoid the strategy_name being overwritten in the loop
@@ -315,6 +344,10 @@ def load_commands() -> None:
                 except ValidationError:
                     logger.exception("Error occured while parsing arguments")
                 else:
+                    # NOTE: Imported here, as the runner pulls in the metrics and output integrations,
+                    #       which are not needed to build the CLI or to show the help
+                    from robusta_krr.core.runner import Runner
+
                     runner = Runner()
                     exit_code = asyncio.run(runner.run())
                     raise typer.Exit(code=exit_code)
@@ -323,20 +356,7 @@ def load_commands() -> None:
             signature = inspect.signature(run_strategy)
             run_strategy.__signature__ = signature.replace(  # type: ignore
                 parameters=list(signature.parameters.values())[:-1]
-                + [
-                    inspect.Parameter(
-                        name=field_name,
-                        kind=inspect.Parameter.KEYWORD_ONLY,
-                        default=OptionInfo(
-                            default=field_meta.default,
-                            param_decls=list(set([f"--{field_name}", f"--{field_name.replace('_', '-')}"])),
-                            help=f"{field_meta.field_info.description}",
-                            rich_help_panel="Strategy Settings",
-                        ),
-                        annotation=__process_type(field_meta.type_),
-                    )
-                    for field_name, field_meta in strategy_type.get_settings_type().__fields__.items()
-                ]
+                + __get_settings_parameters(strategy_type.get_settings_type())
             )
 
             app.command(rich_help_panel="Strategies")(run_strategy)
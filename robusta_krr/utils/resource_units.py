@@ -1,4 +1,5 @@
-from typing import Literal, Union
+from functools import lru_cache
+from typing import Literal, Optional, Union
 
 UNITS: dict[str, float] = {
     "m": 0.001,
@@ -15,24 +16,40 @@ UNITS: dict[str, float] = {
     "P": 1e15,
     "E": 1e18,
 }
+BINARY_UNITS = frozenset({"Ki", "Mi", "Gi", "Ti", "Pi", "Ei"})
 
 
+def _split_unit(x: str, /) -> tuple[str, Optional[str]]:
+    """Splits a string into its number and unit parts. Units are at most two characters long."""
+
+    # NOTE: All two-character units end with "i", which is never a single-character unit,
+    #       so checking the longer suffix first can not shadow a shorter one.
+    if x[-2:] in UNITS:
+        return x[:-2], x[-2:]
+    if x[-1:] in UNITS:
+        return x[:-1], x[-1:]
+    return x, None
+
+
+# NOTE: Clusters reuse a small set of quantity strings (e.g. "100m", "128Mi") across containers,
+#       so the parsed values are cached to skip the string handling for repeated values.
+@lru_cache(maxsize=1024)
 def parse(x: str, /) -> Union[float, int]:
     """Converts a string to an integer with respect of units."""
 
-    for unit, multiplier in UNITS.items():
-        if x.endswith(unit):
-            return float(x[: -len(unit)]) * multiplier
+    number, unit = _split_unit(x)
+    if unit is None:
+        return float(number)
 
-    return float(x)
+    return float(number) * UNITS[unit]
 
 
 def get_base(x: str, /) -> Literal[1024, 1000]:
     """Returns the base of the unit."""
 
-    for unit, _ in UNITS.items():
-        if x.endswith(unit):
-            return 1024 if unit in ["Ki", "Mi", "Gi", "Ti", "Pi", "Ei"] else 1000
+    _, unit = _split_unit(x)
+    if unit is not None:
+        return 1024 if unit in BINARY_UNITS else 1000
     return 1000 if "." in x else 1024
 
 
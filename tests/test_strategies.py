@@ -0,0 +1,33 @@
+from robusta_krr.core.abstract.strategies import BaseStrategy
+from robusta_krr.strategies import SimpleLimitStrategy, SimpleStrategy
+from robusta_krr.strategies.simple import SimpleStrategySettings
+from robusta_krr.strategies.simple_limit import SimpleLimitStrategySettings
+
+
+def test_get_all_returns_builtin_strategies():
+    assert BaseStrategy.get_all() == {"simple": SimpleStrategy, "simple_limit": SimpleLimitStrategy}
+
+
+def test_find_strategy_by_name():
+    assert BaseStrategy.find("Simple") is SimpleStrategy
+    assert BaseStrategy.find("simple_limit") is SimpleLimitStrategy
+
+
+def test_subclass_of_concrete_strategy_is_not_registered():
+    class CustomSimpleStrategy(SimpleStrategy):
+        pass
+
+    assert BaseStrategy.find("simple") is SimpleStrategy
+    assert CustomSimpleStrategy not in BaseStrategy.get_all().values()
+
+
+def test_get_settings_type_of_builtin_strategies():
+    assert SimpleStrategy.get_settings_type() is SimpleStrategySettings
+    assert SimpleLimitStrategy.get_settings_type() is SimpleLimitStrategySettings
+
+
+def test_subclass_of_concrete_strategy_inherits_settings_type():
+    class CustomSimpleStrategy(SimpleStrategy):
+        pass
+
+    assert CustomSimpleStrategy.get_settings_type() is SimpleStrategySettings
@@ -0,0 +1,38 @@
+import pytest
+
+from robusta_krr.utils import resource_units
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("5m", 0.005),
+        ("100", 100),
+        ("0.5", 0.5),
+        ("3k", 3000),
+        ("128974848000m", 128974848),
+        ("128974848e0", 128974848),
+        ("123Mi", 123 * 1024**2),
+        ("2Gi", 2 * 1024**3),
+        ("1M", 1e6),
+        ("1E", 1e18),
+        ("1Ei", 1024**6),
+    ],
+)
+def test_parse(value: str, expected: float):
+    assert resource_units.parse(value) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("123Mi", 1024),
+        ("1Ei", 1024),
+        ("1M", 1000),
+        ("5m", 1000),
+        ("100", 1024),
+        ("0.5", 1000),
+    ],
+)
+def test_get_base(value: str, expected: int):
+    assert resource_units.get_base(value) == expected